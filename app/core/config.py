@@ -13,6 +13,14 @@ class Settings(BaseSettings):
     SKIP_AUTH: bool = False
     BASE_DIR: Path = Path(__file__).resolve().parent.parent.parent
     MST_DIR: Path = BASE_DIR / "mnt" / "data"
+    # 백테스트 OHLC 가격과 조건 평가용 지표 배열을 float32로 보관
+    # (메모리 대역폭 절반, 소수점 가격은 정밀도 손실 가능 / 현금·평가금액 누적은 항상 float64)
+    BACKTEST_USE_FLOAT32: bool = False
+    # 같은 (전략, 가격 데이터) 조합의 시뮬레이션 결과를 보관할 LRU 캐시 크기 (0이면 사용 안 함)
+    # 항목마다 바 단위 포트폴리오·포지션 이력을 통째로 들고 있으므로 워커당 메모리를 고려해 작게 유지
+    BACKTEST_RESULT_CACHE_SIZE: int = 4
+    # 지표 계산 결과를 보관할 가격 데이터(종목·기간) 수 (0이면 사용 안 함)
+    BACKTEST_INDICATOR_CACHE_SIZE: int = 8
 
 
 settings = Settings()
@@ -5,6 +5,7 @@ from app.utils.router import get_router
 from app.core.tradingview import SUPPORTED_RESOLUTIONS
 
 from fastapi import Query, HTTPException, Depends
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.repositories.ticker import TickerRepository
@@ -58,6 +59,8 @@ async def tv_symbols(
 @router.get(
     "/history",
     response_model=HistoryOut,
+    # OHLCV 배열이 길어질 수 있으므로 JSON 인코딩은 orjson으로 처리
+    response_class=ORJSONResponse,
     summary="OHLCV 데이터",
 )
 async def tv_history(
@@ -6,14 +6,15 @@ API 데이터 형식을 정의합니다.
 """
 
 from .ticker import TickerResponse, TickerSyncResponse
-from .user import (ErrorResponse, UserCreateRequest, UserListResponse,
-                   UserResponse, UserUpdateRequest)
+from .user import (USER_LIST_ADAPTER, ErrorResponse, UserCreateRequest,
+                   UserListResponse, UserResponse, UserUpdateRequest)
 
 __all__ = [
     "UserCreateRequest",
     "UserUpdateRequest",
     "UserResponse",
     "UserListResponse",
+    "USER_LIST_ADAPTER",
     "ErrorResponse",
     "TickerSyncResponse",
     "TickerResponse",
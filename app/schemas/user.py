@@ -1,7 +1,7 @@
 # schemas/user.py
 from datetime import datetime
 from typing import Optional
-from pydantic import BaseModel, EmailStr, Field, field_validator
+from pydantic import BaseModel, EmailStr, Field, TypeAdapter, field_validator
 
 
 class UserCreateRequest(BaseModel):
@@ -81,6 +81,10 @@ class UserResponse(BaseModel):
         }
 
 
+# 사용자 목록 검증기 (core schema를 import 시점에 한 번만 빌드해 재사용)
+USER_LIST_ADAPTER = TypeAdapter(list[UserResponse])
+
+
 class UserListResponse(BaseModel):
     """
     사용자 목록 응답 스키마
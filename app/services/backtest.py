@@ -1,15 +1,115 @@
+import asyncio
+import contextlib
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Optional, Any
 from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime
 
+from app.core.config import settings
 from app.repositories.backtest import BacktestRepository
 from app.schemas.backtest import StrategyDefinitionSchema, ConditionGroupSchema, ConditionSchema, OperatorEnum
 from app.utils.indicator_calculator import calculate_indicators
+from app.utils import backtest_kernels as kernels
 from app.repositories.ticker import TickerRepository
 from app.repositories.price import PriceRepository
 
+logger = logging.getLogger(__name__)
+
+
+# OperatorEnum → Numba 조건 커널의 연산자 코드 (모듈 로드 시 한 번 구성)
+_OPERATOR_CODES: Dict[OperatorEnum, int] = {
+    OperatorEnum.IS_ABOVE: kernels.OP_ABOVE,
+    OperatorEnum.IS_BELOW: kernels.OP_BELOW,
+    OperatorEnum.IS_ABOVE_OR_EQUAL: kernels.OP_ABOVE_OR_EQUAL,
+    OperatorEnum.IS_BELOW_OR_EQUAL: kernels.OP_BELOW_OR_EQUAL,
+    OperatorEnum.EQUALS: kernels.OP_EQUALS,
+    OperatorEnum.NOT_EQUALS: kernels.OP_NOT_EQUALS,
+    OperatorEnum.CROSSES_ABOVE: kernels.OP_CROSSES_ABOVE,
+    OperatorEnum.CROSSES_BELOW: kernels.OP_CROSSES_BELOW,
+    OperatorEnum.BETWEEN: kernels.OP_BETWEEN,
+    OperatorEnum.OUTSIDE: kernels.OP_OUTSIDE,
+    OperatorEnum.PERCENT_CHANGE_ABOVE: kernels.OP_PERCENT_CHANGE_ABOVE,
+    OperatorEnum.PERCENT_CHANGE_BELOW: kernels.OP_PERCENT_CHANGE_BELOW,
+    OperatorEnum.CONSECUTIVE_ABOVE: kernels.OP_CONSECUTIVE_ABOVE,
+    OperatorEnum.CONSECUTIVE_BELOW: kernels.OP_CONSECUTIVE_BELOW,
+}
+
+# lookback_period가 없을 때의 연산자별 기본 기간
+_DEFAULT_LOOKBACK: Dict[OperatorEnum, int] = {
+    OperatorEnum.PERCENT_CHANGE_ABOVE: 1,
+    OperatorEnum.PERCENT_CHANGE_BELOW: 1,
+    OperatorEnum.CONSECUTIVE_ABOVE: 3,
+    OperatorEnum.CONSECUTIVE_BELOW: 3,
+}
+
+_EMPTY_ARRAY = np.empty(0, dtype=np.float64)
+
+
+def _empty_trades() -> Dict[str, np.ndarray]:
+    """체결 내역(열 단위 배열)의 빈 값."""
+    return {
+        'index': np.empty(0, dtype=np.int64),
+        'is_buy': np.empty(0, dtype=bool),
+        'price': np.empty(0, dtype=np.float64),
+        'quantity': np.empty(0, dtype=np.float64),
+        'profit': np.empty(0, dtype=np.float64),
+    }
+
+# (전략, 가격 데이터) 해시 → 시뮬레이션 결과 (프로세스 단위 LRU, 파라미터 스윕 중복 실행 방지)
+_RESULT_CACHE: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+# 가격 데이터 해시 → 지표 캐시 (같은 종목·기간에 전략만 바꿔 반복 실행할 때 지표 재사용)
+_INDICATOR_CACHES: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+# 프로세스 안에서 시뮬레이션이 한 번에 하나만 돌도록 보호 (위 모듈 캐시는 스레드 안전하지 않음)
+_SIMULATION_LOCK = threading.Lock()
+
+# run()이 시뮬레이션을 실행하는 전용 스레드 (기본 executor를 대기 중인 백테스트가 점유하지 않도록 분리)
+_SIMULATION_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="backtest")
+
+
+class _ThreadSilencedStdout:
+    """sys.stdout 프록시. _suppress_stdout() 안에 있는 스레드의 출력만 버리고 나머지 스레드는 원래 스트림으로 보냅니다."""
+
+    _silenced = threading.local()
+
+    def __init__(self, stream):
+        self._stream = stream
+
+    def write(self, text):
+        if getattr(self._silenced, 'active', False):
+            return len(text)
+        return self._stream.write(text)
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+_STDOUT_PROXY_LOCK = threading.Lock()
+
+
+@contextlib.contextmanager
+def _suppress_stdout():
+    """현재 스레드의 stdout 출력만 버립니다. (sys.stdout 교체는 프로세스 전역이라 스레드에서 쓸 수 없음)"""
+    with _STDOUT_PROXY_LOCK:
+        if not isinstance(sys.stdout, _ThreadSilencedStdout):
+            sys.stdout = _ThreadSilencedStdout(sys.stdout)
+    _ThreadSilencedStdout._silenced.active = True
+    try:
+        yield
+    finally:
+        _ThreadSilencedStdout._silenced.active = False
+
 
 class BacktestService:
     def __init__(self, strategy_definition: StrategyDefinitionSchema, db: AsyncSession):
@@ -17,15 +117,27 @@ class BacktestService:
         self.db = db
         self.historical_data: Optional[pd.DataFrame] = None
         self.indicators_data: Dict[str, pd.Series | pd.DataFrame] = {}
+        # 같은 가격 데이터로 여러 전략을 돌릴 때 공유하는 지표 결과 캐시 (run_batch 워커 또는 데이터 해시별 캐시)
+        self._indicator_cache: Optional[Dict[str, Any]] = None
+        # 지표 이름 → 전체 기간 배열 해석 결과 캐시 (지표 재계산 시 초기화)
+        self._array_cache: Dict[str, Optional[np.ndarray]] = {}
+        # 조건 정규화 키 → 전체 기간 bool 신호 배열 (동일 조건 중복 계산 방지)
+        self._signal_cache: Dict[str, np.ndarray] = {}
+        # 조건 그룹을 축약한 바별 매수/매도 신호
+        self._buy_signal: np.ndarray = np.zeros(0, dtype=bool)
+        self._sell_signal: np.ndarray = np.zeros(0, dtype=bool)
         
         # Trading state
-        self.trades: List[Dict] = []
+        # 체결 내역 (열 단위 배열: index, is_buy, price, quantity, profit — 매수의 profit은 0)
+        self.trades: Dict[str, np.ndarray] = _empty_trades()
         self.position: Optional[Dict] = None
         self.initial_cash = 10_000_000
         self.cash = self.initial_cash
         
-        # For performance calculation
-        self.portfolio_history: List[Dict] = []
+        # For performance calculation (index: 날짜, values: 포트폴리오 가치)
+        self.portfolio_history: pd.Series = pd.Series(dtype=np.float64)
+        # 바별 ISO 타임스탬프 문자열 (결과 직렬화 시 공통으로 사용)
+        self._timestamps: List[str] = []
 
     async def _load_data(self, ticker: str, start_date: str, end_date: str):
         """
@@ -52,236 +164,410 @@ class BacktestService:
         if not price_data_models:
             raise ValueError(f"No price data found for ticker '{ticker}' in the given date range.")
 
-        # Convert list of Pydantic models to pandas DataFrame
-        data = [
-            {
-                "timestamp": p.timestamp,
-                "open": float(p.open),
-                "high": float(p.high),
-                "low": float(p.low),
-                "close": float(p.close),
-                "volume": p.volume,
-            }
-            for p in price_data_models
-        ]
+        # 행마다 dict를 만들지 않고 컬럼 배열을 미리 할당해 한 번의 루프로 채웁니다.
+        n = len(price_data_models)
+        open_, high, low, close = (np.empty(n, dtype=np.float64) for _ in range(4))
+        timestamps = [None] * n
+        # volume은 NULL이 있을 수 있으므로 기존과 같이 pandas의 타입 추론에 맡깁니다. (int64 또는 NaN 포함 float64)
+        volume = [None] * n
+        for i, p in enumerate(price_data_models):
+            timestamps[i] = p.timestamp
+            open_[i] = float(p.open)
+            high[i] = float(p.high)
+            low[i] = float(p.low)
+            close[i] = float(p.close)
+            volume[i] = p.volume
+
+        df = pd.DataFrame(
+            {"open": open_, "high": high, "low": low, "close": close, "volume": volume},
+            index=pd.Index(timestamps, name="timestamp"),
+        )
 
-        df = pd.DataFrame(data)
-        df = df.set_index("timestamp")
+        if settings.BACKTEST_USE_FLOAT32:
+            # 지표/조건 계산은 float32로 충분하며, 현금·평가금액 계산은 float64로 유지합니다.
+            price_cols = ["open", "high", "low", "close"]
+            df[price_cols] = df[price_cols].astype(np.float32)
 
         self.historical_data = df
-        print(f"✓ Loaded {len(self.historical_data)} price records ({start_date} ~ {end_date})")
+        logger.info(f"✓ Loaded {len(self.historical_data)} price records ({start_date} ~ {end_date})")
 
 
     def _calculate_indicators(self):
         if self.historical_data is None:
             raise ValueError("Historical data is not loaded.")
 
-        # Suppress pandas-ta verbose output
-        import sys
-        import io
-        old_stdout = sys.stdout
-        sys.stdout = io.StringIO()  # Redirect stdout to suppress output
+        # 매수/매도 조건에서 참조하지 않는 지표는 계산하지 않습니다.
+        referenced = self._referenced_indicator_names()
+        indicator_definitions = [
+            indicator_def for indicator_def in self.strategy.indicators if indicator_def.name in referenced
+        ]
 
-        try:
+        # Suppress pandas-ta verbose output (pandas-ta는 logging이 아닌 print로 출력합니다)
+        with _suppress_stdout():
             self.indicators_data = calculate_indicators(
-                self.historical_data, self.strategy.indicators
+                self.historical_data, indicator_definitions, cache=self._indicator_cache
             )
-        finally:
-            sys.stdout = old_stdout  # Restore stdout
-
-        print(f"✓ Indicators calculated: {', '.join(self.indicators_data.keys())}")
-
-    def _get_value(self, indicator_name: str, index: int) -> Optional[float]:
-        """특정 시점(index)의 지표 값 또는 가격을 가져옵니다."""
-        if self.historical_data is None: return None
+        self._array_cache = {}
+
+        logger.info(f"✓ Indicators calculated: {', '.join(self.indicators_data.keys())}")
+
+    def _referenced_indicator_names(self) -> set[str]:
+        """매수/매도 조건이 참조하는 지표 이름 집합. 복합 지표("BBANDS.BBU_20_2.0")는 앞부분 이름도 포함합니다."""
+        names = set()
+        for group in (self.strategy.buy_conditions, self.strategy.sell_conditions):
+            for condition in (group.all or []) + (group.any or []):
+                for indicator_name in (condition.indicator1, condition.indicator2, condition.indicator3):
+                    if indicator_name:
+                        names.add(indicator_name)
+                        names.add(indicator_name.split('.', 1)[0])
+        return names
+
+    def _resolve_array(self, indicator_name: str) -> Optional[np.ndarray]:
+        """
+        지표 이름을 전체 기간의 실수 배열로 해석합니다. 해석할 수 없으면 None.
+        BACKTEST_USE_FLOAT32 설정 시 float32, 아니면 float64 배열입니다.
+        이름 해석과 배열 변환은 이름당 한 번만 수행하고 결과를 캐시합니다.
+        """
+        if indicator_name in self._array_cache:
+            return self._array_cache[indicator_name]
 
+        series: Optional[pd.Series | pd.DataFrame] = None
         # 'price', 'close' 등 기본 가격 정보 처리
         if indicator_name.lower() in ['price', 'close', 'open', 'high', 'low']:
-            return self.historical_data[indicator_name.lower()].iloc[index]
+            series = self.historical_data[indicator_name.lower()]
 
         # 복합 지표 처리 (e.g., "BBANDS.BBU_20_2.0")
-        if '.' in indicator_name:
+        elif '.' in indicator_name:
             main_indicator, column_name = indicator_name.split('.', 1)
-            if main_indicator not in self.indicators_data:
-                return None
-            
-            indicator_df = self.indicators_data[main_indicator]
+            indicator_df = self.indicators_data.get(main_indicator)
+            # DataFrame이 아니거나 컬럼이 존재하지 않으면 None
             if isinstance(indicator_df, pd.DataFrame) and column_name in indicator_df.columns:
-                try:
-                    return indicator_df[column_name].iloc[index]
-                except IndexError:
-                    return None
-            else:
-                return None # DataFrame이 아니거나 컬럼이 존재하지 않음
+                series = indicator_df[column_name]
 
         # 단일 지표 처리
-        if indicator_name not in self.indicators_data:
-            return None
-        
-        try:
-            # Series인 경우
-            return self.indicators_data[indicator_name].iloc[index]
-        except (AttributeError, IndexError):
-            return None
-
-    def _check_single_condition(self, condition: ConditionSchema, index: int) -> bool:
-        """단일 조건을 평가합니다."""
-        # 기본 값 조회
-        val1_curr = self._get_value(condition.indicator1, index)
-        val2_curr = self._get_value(condition.indicator2, index)
-
-        if val1_curr is None or val2_curr is None:
-            return False
-
-        # 기본 비교 연산자
-        if condition.operator == OperatorEnum.IS_ABOVE:
-            return val1_curr > val2_curr
-        elif condition.operator == OperatorEnum.IS_BELOW:
-            return val1_curr < val2_curr
-        elif condition.operator == OperatorEnum.IS_ABOVE_OR_EQUAL:
-            return val1_curr >= val2_curr
-        elif condition.operator == OperatorEnum.IS_BELOW_OR_EQUAL:
-            return val1_curr <= val2_curr
-        elif condition.operator == OperatorEnum.EQUALS:
-            return abs(val1_curr - val2_curr) < 1e-9  # Float 비교
-        elif condition.operator == OperatorEnum.NOT_EQUALS:
-            return abs(val1_curr - val2_curr) >= 1e-9
-
-        # 크로스 연산자 (이전 값 필요)
-        elif condition.operator in [OperatorEnum.CROSSES_ABOVE, OperatorEnum.CROSSES_BELOW]:
-            if index == 0:
-                return False
-            val1_prev = self._get_value(condition.indicator1, index - 1)
-            val2_prev = self._get_value(condition.indicator2, index - 1)
-            if val1_prev is None or val2_prev is None:
-                return False
-
-            if condition.operator == OperatorEnum.CROSSES_ABOVE:
-                return val1_prev <= val2_prev and val1_curr > val2_curr
-            elif condition.operator == OperatorEnum.CROSSES_BELOW:
-                return val1_prev >= val2_prev and val1_curr < val2_curr
-
-        # 범위 연산자
-        elif condition.operator == OperatorEnum.BETWEEN:
-            if condition.indicator3 is None:
-                return False
-            val3 = self._get_value(condition.indicator3, index)
-            if val3 is None:
-                return False
-            lower = min(val2_curr, val3)
-            upper = max(val2_curr, val3)
-            return lower < val1_curr < upper
-
-        elif condition.operator == OperatorEnum.OUTSIDE:
+        else:
+            series = self.indicators_data.get(indicator_name)
+
+        dtype = np.float32 if settings.BACKTEST_USE_FLOAT32 else np.float64
+        array = None
+        if isinstance(series, pd.Series):
+            # 여러 지표를 한 번에 계산한 2차원 결과의 열은 strided view일 수 있으므로,
+            # 조건 커널이 연속 메모리를 순차로 읽도록 한 번만 연속 배열로 맞춥니다.
+            array = np.ascontiguousarray(series.to_numpy(dtype=dtype))
+        self._array_cache[indicator_name] = array
+        return array
+
+    @staticmethod
+    def _condition_key(condition: ConditionSchema) -> str:
+        """동일한 조건을 한 번만 계산하기 위한 정규화 키."""
+        return json.dumps(condition.model_dump(mode="json"), sort_keys=True)
+
+    def _evaluate_condition_array(self, condition: ConditionSchema) -> np.ndarray:
+        """단일 조건을 전체 기간에 대해 한 번에 평가하여 bool 배열로 반환합니다."""
+        n = len(self.historical_data)
+        result = np.zeros(n, dtype=bool)
+
+        val1 = self._resolve_array(condition.indicator1)
+        val2 = self._resolve_array(condition.indicator2)
+        if val1 is None or val2 is None:
+            return result
+
+        op_code = _OPERATOR_CODES.get(condition.operator)
+        if op_code is None:
+            return result
+
+        # 범위 연산자는 세 번째 값(두 번째 경계)이 필요
+        val3 = _EMPTY_ARRAY
+        if condition.operator in (OperatorEnum.BETWEEN, OperatorEnum.OUTSIDE):
             if condition.indicator3 is None:
-                return False
-            val3 = self._get_value(condition.indicator3, index)
+                return result
+            val3 = self._resolve_array(condition.indicator3)
             if val3 is None:
-                return False
-            lower = min(val2_curr, val3)
-            upper = max(val2_curr, val3)
-            return val1_curr < lower or val1_curr > upper
-
-        # 변화율 연산자
-        elif condition.operator in [OperatorEnum.PERCENT_CHANGE_ABOVE, OperatorEnum.PERCENT_CHANGE_BELOW]:
-            lookback = condition.lookback_period or 1
-            if index < lookback:
-                return False
-
-            val1_prev = self._get_value(condition.indicator1, index - lookback)
-            if val1_prev is None or val1_prev == 0:
-                return False
-
-            # 변화율 계산 (%)
-            pct_change = ((val1_curr - val1_prev) / val1_prev) * 100
-            threshold = val2_curr  # indicator2는 기준 변화율 (%)
-
-            if condition.operator == OperatorEnum.PERCENT_CHANGE_ABOVE:
-                return pct_change > threshold
-            elif condition.operator == OperatorEnum.PERCENT_CHANGE_BELOW:
-                return pct_change < threshold
-
-        # 연속 조건 연산자
-        elif condition.operator in [OperatorEnum.CONSECUTIVE_ABOVE, OperatorEnum.CONSECUTIVE_BELOW]:
-            lookback = condition.lookback_period or 3
-            if index < lookback - 1:
-                return False
-
-            # lookback 기간 동안 모든 값이 조건을 만족하는지 확인
-            for i in range(lookback):
-                curr_index = index - i
-                val1 = self._get_value(condition.indicator1, curr_index)
-                val2 = self._get_value(condition.indicator2, curr_index)
-
-                if val1 is None or val2 is None:
-                    return False
-
-                if condition.operator == OperatorEnum.CONSECUTIVE_ABOVE:
-                    if val1 <= val2:
-                        return False
-                elif condition.operator == OperatorEnum.CONSECUTIVE_BELOW:
-                    if val1 >= val2:
-                        return False
-
-            return True
-
-        return False
-
-    def _check_condition_group(self, group: ConditionGroupSchema, index: int) -> bool:
-        # ... (이전과 동일)
-        if group.all: return all(self._check_single_condition(cond, index) for cond in group.all)
-        if group.any: return any(self._check_single_condition(cond, index) for cond in group.any)
-        return False
-
-    def _evaluate_conditions(self, index: int) -> str:
-        # ... (이전과 동일)
-        if self.position is None:
-            if self._check_condition_group(self.strategy.buy_conditions, index): return "buy"
-        else:
-            if self._check_condition_group(self.strategy.sell_conditions, index): return "sell"
-        return "hold"
+                return result
+
+        lookback = condition.lookback_period or _DEFAULT_LOOKBACK.get(condition.operator, 0)
+        return kernels.evaluate_condition(op_code, val1, val2, val3, lookback)
+
+    def _condition_signal(self, condition: ConditionSchema) -> np.ndarray:
+        """조건의 신호 배열을 반환합니다. 같은 조건은 정규화 키 기준으로 한 번만 계산합니다."""
+        key = self._condition_key(condition)
+        if key not in self._signal_cache:
+            self._signal_cache[key] = self._evaluate_condition_array(condition)
+        return self._signal_cache[key]
+
+    def _combine_condition_group(self, group: ConditionGroupSchema) -> np.ndarray:
+        """조건 그룹(all: AND / any: OR)을 하나의 bool 배열로 축약합니다."""
+        if group.all:
+            return np.logical_and.reduce([self._condition_signal(cond) for cond in group.all])
+        if group.any:
+            return np.logical_or.reduce([self._condition_signal(cond) for cond in group.any])
+        return np.zeros(len(self.historical_data), dtype=bool)
+
+    def _precompute_signals(self):
+        """
+        매수/매도 조건 트리를 전체 기간에 대해 미리 평가하여
+        바별 매수 신호(self._buy_signal)와 매도 신호(self._sell_signal) 배열을 만듭니다.
+        """
+        self._signal_cache = {}
+        self._buy_signal = self._combine_condition_group(self.strategy.buy_conditions)
+        self._sell_signal = self._combine_condition_group(self.strategy.sell_conditions)
 
-    def _execute_buy(self, index: int):
-        # ... (이전과 동일)
+    def _build_portfolio_history(self, held_quantity: np.ndarray, close: np.ndarray):
+        """
+        바별 보유 수량으로부터 포트폴리오 가치 시계열을 한 번에 계산합니다.
+        매매는 종가로 체결되므로 체결 시점의 가치는 변하지 않고,
+        value[i] = value[i-1] + held[i-1] * (close[i] - close[i-1]) 인 누적합이 됩니다.
+        """
         if self.historical_data is None: return
-        price = self.historical_data['close'].iloc[index]
-        date = self.historical_data.index[index]
-        amount_to_invest = self.cash * (self.strategy.trade_settings.order_amount_percent / 100)
-        quantity = amount_to_invest // price
-        if quantity > 0:
-            cost = quantity * price
-            cash_before = self.cash
-            self.cash -= cost
-            self.position = {'quantity': quantity, 'entry_price': price, 'entry_date': date}
-            self.trades.append({'type': 'buy', 'date': date, 'price': price, 'quantity': quantity})
-            print(f"  [{date.date()}] BUY  {int(quantity):>4} shares @ {price:>8,.0f} KRW | Cash: {cash_before:>12,.0f} → {self.cash:>12,.0f}")
-
-    def _execute_sell(self, index: int):
-        # ... (이전과 동일)
-        if self.position is None or self.historical_data is None: return
-        price = self.historical_data['close'].iloc[index]
-        date = self.historical_data.index[index]
-        quantity = self.position['quantity']
-        sale_value = quantity * price
-        cash_before = self.cash
-        self.cash += sale_value
-        profit = (price - self.position['entry_price']) * quantity
-        self.trades.append({'type': 'sell', 'date': date, 'price': price, 'quantity': quantity, 'profit': profit})
-        profit_sign = "+" if profit >= 0 else ""
-        print(f"  [{date.date()}] SELL {int(quantity):>4} shares @ {price:>8,.0f} KRW | P&L: {profit_sign}{profit:>10,.0f} | Cash: {cash_before:>12,.0f} → {self.cash:>12,.0f}")
+        pnl = np.zeros(len(close), dtype=np.float64)
+        pnl[1:] = held_quantity[:-1] * np.diff(close)
+        values = self.initial_cash + np.cumsum(pnl)
+        self.portfolio_history = pd.Series(values, index=self.historical_data.index, name='value')
+
+    def _simulate(self) -> tuple[int, int]:
+        """
+        미리 계산된 신호로 매매를 시뮬레이션합니다. (DB 접근 없음)
+        포지션 상태 전이는 Numba 커널(kernels.simulate_long_only)에서 한 번에 처리합니다.
+
+        Returns:
+            (매수 신호 수, 매도 신호 수)
+        """
+        self.cash = self.initial_cash
         self.position = None
+        self.trades = _empty_trades()
+        self.portfolio_history = pd.Series(dtype=np.float64)
+        self._timestamps = []
 
-    def _update_portfolio_value(self, index: int):
-        # ... (이전과 동일)
-        if self.historical_data is None: return
-        current_price = self.historical_data['close'].iloc[index]
-        holdings_value = self.position['quantity'] * current_price if self.position else 0
-        total_value = self.cash + holdings_value
-        self.portfolio_history.append({'date': self.historical_data.index[index], 'value': total_value})
+        if self.historical_data is None:
+            return 0, 0
+
+        # 조건 평가에서 이미 만든 연속 종가 배열을 재사용하고,
+        # float32로 보관 중이면 현금·평가금액 계산을 위해 float64로 한 번만 변환
+        close = self._resolve_array('close')
+        if close.dtype != np.float64:
+            close = close.astype(np.float64)
+        invest_ratio = self.strategy.trade_settings.order_amount_percent / 100
+        (trade_index, trade_is_buy, trade_price, trade_quantity, trade_profit, trade_cash,
+         held_quantity, buy_signal_count, sell_signal_count) = kernels.simulate_long_only(
+            self._buy_signal, self._sell_signal, close, float(self.initial_cash), invest_ratio
+        )
+
+        self.trades = {
+            'index': trade_index,
+            'is_buy': trade_is_buy,
+            'price': trade_price,
+            'quantity': trade_quantity,
+            'profit': trade_profit,
+        }
+
+        if len(trade_index):
+            if trade_is_buy[-1]:
+                self.position = {
+                    'quantity': float(trade_quantity[-1]),
+                    'entry_price': float(trade_price[-1]),
+                    'entry_index': int(trade_index[-1]),
+                }
+            self.cash = float(trade_cash[-1])
+
+        # 체결 로그는 문자열 포맷 비용이 크므로 DEBUG 레벨일 때만 만듭니다.
+        if logger.isEnabledFor(logging.DEBUG):
+            self._log_trades(trade_cash)
+
+        # 시뮬레이션에 쓴 float64 종가 배열을 그대로 재사용 (float32 저장 시 재변환 방지)
+        self._build_portfolio_history(held_quantity, close)
+        # equity curve / 드로우다운 / 포지션 히스토리가 같은 시간축을 쓰므로 문자열 변환은 한 번만 수행
+        self._timestamps = [date.isoformat() for date in self.historical_data.index]
+        return int(buy_signal_count), int(sell_signal_count)
+
+    def _log_trades(self, trade_cash: np.ndarray):
+        """체결 내역을 한 줄씩 DEBUG 로그로 남깁니다. (trade_cash: 체결 직후 현금)"""
+        dates = self.historical_data.index
+        cash_before = float(self.initial_cash)
+        for index, is_buy, price, quantity, profit, cash in zip(
+            self.trades['index'].tolist(), self.trades['is_buy'].tolist(), self.trades['price'].tolist(),
+            self.trades['quantity'].tolist(), self.trades['profit'].tolist(), trade_cash.tolist(),
+        ):
+            if is_buy:
+                logger.debug(f"  [{dates[index].date()}] BUY  {int(quantity):>4} shares @ {price:>8,.0f} KRW | Cash: {cash_before:>12,.0f} → {cash:>12,.0f}")
+            else:
+                profit_sign = "+" if profit >= 0 else ""
+                logger.debug(f"  [{dates[index].date()}] SELL {int(quantity):>4} shares @ {price:>8,.0f} KRW | P&L: {profit_sign}{profit:>10,.0f} | Cash: {cash_before:>12,.0f} → {cash:>12,.0f}")
+            cash_before = cash
+
+    def _data_fingerprint(self) -> str:
+        """가격 데이터 전체(인덱스·dtype 포함)의 해시."""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(str(self.historical_data.dtypes.tolist()).encode())
+        digest.update(pd.util.hash_pandas_object(self.historical_data, index=True).to_numpy().tobytes())
+        return digest.hexdigest()
+
+    def _result_cache_key(self, data_fingerprint: str) -> str:
+        """전략 정의와 가격 데이터 해시로 결과 캐시 키를 만듭니다."""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(self.strategy.model_dump_json().encode())
+        digest.update(f"{self.initial_cash}|{settings.BACKTEST_USE_FLOAT32}|{data_fingerprint}".encode())
+        return digest.hexdigest()
+
+    def _attach_indicator_cache(self, data_fingerprint: str):
+        """같은 가격 데이터로 계산한 적 있는 지표를 재사용하도록 데이터별 지표 캐시를 연결합니다."""
+        cache_size = settings.BACKTEST_INDICATOR_CACHE_SIZE
+        if self._indicator_cache is not None or cache_size <= 0:
+            return
+        cache = _INDICATOR_CACHES.get(data_fingerprint)
+        if cache is None:
+            cache = _INDICATOR_CACHES[data_fingerprint] = {}
+            while len(_INDICATOR_CACHES) > cache_size:
+                _INDICATOR_CACHES.popitem(last=False)
+        else:
+            _INDICATOR_CACHES.move_to_end(data_fingerprint)
+        self._indicator_cache = cache
+
+    def _run_simulation(self) -> tuple[int, int, Dict[str, Any]]:
+        """
+        지표 계산 → 신호 계산 → 매매 시뮬레이션 → 성과 지표 계산을 수행합니다. (DB 접근 없음)
+        같은 전략과 가격 데이터 조합은 캐시된 결과를 재사용합니다. (결과는 읽기 전용으로 사용)
+
+        모듈 캐시를 공유하므로 프로세스 전역 락 안에서 실행합니다. (스레드·직렬 경로 모두)
+
+        Returns:
+            (매수 신호 수, 매도 신호 수, 성과 지표)
+        """
+        with _SIMULATION_LOCK:
+            cache_size = settings.BACKTEST_RESULT_CACHE_SIZE
+            # 두 캐시가 모두 꺼져 있으면 프레임 전체 해시를 계산하지 않습니다.
+            caching = cache_size > 0 or settings.BACKTEST_INDICATOR_CACHE_SIZE > 0
+            data_fingerprint = self._data_fingerprint() if caching else None
+            key = self._result_cache_key(data_fingerprint) if cache_size > 0 else None
+            cached = _RESULT_CACHE.get(key) if key is not None else None
+            if cached is not None:
+                _RESULT_CACHE.move_to_end(key)
+                self.trades = cached['trades']
+                self.position = cached['position']
+                self.cash = cached['cash']
+                self.portfolio_history = cached['portfolio_history']
+                self._timestamps = cached['timestamps']
+                logger.info("✓ Reusing cached simulation result")
+                return cached['buy_signal_count'], cached['sell_signal_count'], dict(cached['performance'])
+
+            if data_fingerprint is not None:
+                self._attach_indicator_cache(data_fingerprint)
+            self._calculate_indicators()
+            self._precompute_signals()
+
+            logger.info("✓ Starting simulation...")
+            buy_signal_count, sell_signal_count = self._simulate()
+            performance = self._calculate_performance_metrics()
+
+            if key is not None:
+                _RESULT_CACHE[key] = {
+                    'trades': self.trades,
+                    'position': self.position,
+                    'cash': self.cash,
+                    'portfolio_history': self.portfolio_history,
+                    'timestamps': self._timestamps,
+                    'buy_signal_count': buy_signal_count,
+                    'sell_signal_count': sell_signal_count,
+                    'performance': dict(performance),
+                }
+                while len(_RESULT_CACHE) > cache_size:
+                    _RESULT_CACHE.popitem(last=False)
+
+            return buy_signal_count, sell_signal_count, performance
+
+    @classmethod
+    def run_batch(
+        cls,
+        strategies: List[StrategyDefinitionSchema],
+        historical_data: pd.DataFrame,
+        n_jobs: int = -1,
+    ) -> List[Dict[str, Any]]:
+        """
+        같은 가격 데이터에 여러 전략을 프로세스 풀에서 병렬로 백테스트합니다.
+        결과는 DB에 저장하지 않으며, 입력 전략 순서대로 성과 지표를 반환합니다.
+
+        Args:
+            strategies: 백테스트할 전략 정의 목록 (파라미터 스윕 등)
+            historical_data: 'open', 'high', 'low', 'close', 'volume' 컬럼과 날짜 인덱스를 가진 OHLCV 데이터
+            n_jobs: 워커 프로세스 수 (-1이면 CPU 코어 수)
+        """
+        max_workers = (os.cpu_count() or 1) if n_jobs == -1 else max(1, n_jobs)
+        max_workers = min(max_workers, len(strategies))
+        if max_workers <= 1:
+            # 워커 전용 모듈 전역에 데이터를 남기지 않도록 호출 범위의 지표 캐시를 씁니다.
+            indicator_cache: Dict[str, Any] = {}
+            results = []
+            for strategy in strategies:
+                service = cls(strategy, db=None)
+                service.historical_data = historical_data
+                service._indicator_cache = indicator_cache
+                _, _, performance = service._run_simulation()
+                results.append({
+                    "strategy_name": strategy.strategy_name,
+                    **performance
+                })
+            return results
+
+        # 가격 데이터는 워커마다 한 번만 전달하고, 작업 단위로는 전략만 직렬화합니다.
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_batch_worker,
+            initargs=(historical_data,),
+        ) as pool:
+            return list(pool.map(_run_batch_item, strategies))
+
+    @classmethod
+    async def run_many(
+        cls,
+        strategies_and_tickers: List[tuple[StrategyDefinitionSchema, str]],
+        start_date: str,
+        end_date: str,
+        db: AsyncSession,
+        n_jobs: int = -1,
+    ) -> List[Dict[str, Any]]:
+        """
+        여러 (전략, 종목) 조합을 프로세스 풀에서 병렬로 백테스트합니다. (포트폴리오 백테스트)
+        가격 데이터는 주어진 세션으로 종목당 한 번만 로드하고, 시뮬레이션만 워커 프로세스에서 실행합니다.
+        결과는 DB에 저장하지 않으며, 입력 순서대로 성과 지표를 반환합니다.
+
+        Args:
+            strategies_and_tickers: (전략 정의, 티커) 목록
+            start_date, end_date: 백테스트 기간 (YYYY-MM-DD)
+            db: 가격 데이터 조회용 세션 (워커 프로세스에는 전달하지 않음)
+            n_jobs: 워커 프로세스 수 (-1이면 CPU 코어 수)
+        """
+        # AsyncSession은 프로세스 간에 공유할 수 없으므로 DB 조회는 호출 프로세스에서 끝냅니다.
+        data_by_ticker: Dict[str, pd.DataFrame] = {}
+        for strategy, ticker in strategies_and_tickers:
+            if ticker not in data_by_ticker:
+                loader = cls(strategy, db)
+                await loader._load_data(ticker, start_date, end_date)
+                data_by_ticker[ticker] = loader.historical_data
+
+        max_workers = (os.cpu_count() or 1) if n_jobs == -1 else max(1, n_jobs)
+        max_workers = min(max_workers, len(strategies_and_tickers))
+        # 워커가 계산하는 동안 이벤트 루프를 막지 않도록 run_in_executor로 제출합니다.
+        loop = asyncio.get_running_loop()
+        if max_workers <= 1:
+            return [
+                await loop.run_in_executor(
+                    _SIMULATION_EXECUTOR, _run_many_item, strategy, ticker, data_by_ticker[ticker]
+                )
+                for strategy, ticker in strategies_and_tickers
+            ]
+
+        # 스레드가 도는 서버 프로세스를 fork하면 잡힌 락 때문에 자식이 멈출 수 있으므로 spawn으로 띄웁니다.
+        with ProcessPoolExecutor(
+            max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")
+        ) as pool:
+            return list(await asyncio.gather(*(
+                loop.run_in_executor(pool, _run_many_item, strategy, ticker, data_by_ticker[ticker])
+                for strategy, ticker in strategies_and_tickers
+            )))
 
     def _calculate_performance_metrics(self) -> Dict[str, Any]:
         """시뮬레이션 결과를 바탕으로 최종 성과 지표를 계산합니다."""
-        if not self.portfolio_history:
+        if self.portfolio_history.empty:
             return {
                 "total_return": 0,
                 "win_rate": 0,
@@ -301,26 +587,27 @@ class BacktestService:
                 "position_history": []
             }
 
+        # 포트폴리오 가치 배열 (시뮬레이션에서 만든 float64 배열, 복사 없음)
+        values = self.portfolio_history.to_numpy()
+
         # 1. 총수익률
-        final_portfolio_value = self.portfolio_history[-1]['value']
+        final_portfolio_value = float(values[-1])
         total_return = (final_portfolio_value - self.initial_cash) / self.initial_cash
 
         # 2. 거래 카운트
-        buy_trades = [t for t in self.trades if t['type'] == 'buy']
-        sell_trades = [t for t in self.trades if t['type'] == 'sell']
-        buy_count = len(buy_trades)
-        sell_count = len(sell_trades)
+        is_buy = self.trades['is_buy']
+        buy_count = int(np.count_nonzero(is_buy))
+        sell_count = len(is_buy) - buy_count
         total_actions = buy_count + sell_count
         completed_trades = sell_count  # 완료된 라운드 트립
 
         # 3. 승률 및 손익비
-        winning_trades = [t for t in sell_trades if t.get('profit', 0) > 0]
-        losing_trades = [t for t in sell_trades if t.get('profit', 0) < 0]
-        win_rate = len(winning_trades) / len(sell_trades) if sell_trades else 0
+        sell_profits = self.trades['profit'][~is_buy]
+        win_rate = float(np.count_nonzero(sell_profits > 0)) / sell_count if sell_count else 0
 
         # 손익비 (Profit Factor) = 총 이익 / 총 손실
-        total_profit = sum(t.get('profit', 0) for t in winning_trades)
-        total_loss = abs(sum(t.get('profit', 0) for t in losing_trades))
+        total_profit = float(sell_profits[sell_profits > 0].sum())
+        total_loss = abs(float(sell_profits[sell_profits < 0].sum()))
 
         if total_loss > 0:
             profit_factor = total_profit / total_loss
@@ -329,27 +616,24 @@ class BacktestService:
         else:
             profit_factor = 0
 
-        # 4. 포트폴리오 데이터프레임 준비
-        portfolio_df = pd.DataFrame(self.portfolio_history).set_index('date')['value']
-
-        # 5. 최대 낙폭 (MDD) 및 드로우다운 시계열
-        peak = portfolio_df.cummax()
-        drawdown = (portfolio_df - peak) / peak
-        max_drawdown = drawdown.min() if not drawdown.empty else 0
+        # 4. 최대 낙폭 (MDD) 및 드로우다운 시계열
+        peak = np.maximum.accumulate(values)
+        drawdown = (values - peak) / peak
+        max_drawdown = float(drawdown.min())
 
         # 드로우다운 시계열 데이터
         drawdown_series = [
             {
-                "timestamp": idx.isoformat(),
-                "drawdown": float(val)
+                "timestamp": timestamp,
+                "drawdown": val
             }
-            for idx, val in drawdown.items()
+            for timestamp, val in zip(self._timestamps, drawdown.tolist())
         ]
 
-        # 6. CAGR (Compound Annual Growth Rate)
+        # 5. CAGR (Compound Annual Growth Rate)
         if len(self.portfolio_history) > 1:
-            start_date = self.portfolio_history[0]['date']
-            end_date = self.portfolio_history[-1]['date']
+            start_date = self.portfolio_history.index[0]
+            end_date = self.portfolio_history.index[-1]
             days = (end_date - start_date).days
             years = days / 365.25
 
@@ -360,64 +644,65 @@ class BacktestService:
         else:
             cagr = 0
 
-        # 7. 일간 수익률 계산
-        daily_returns = portfolio_df.pct_change().dropna()
+        # 6. 일간 수익률 계산 (pct_change().dropna()와 같은 값을 NumPy 배열로 한 번만 계산)
+        daily_returns = values[1:] / values[:-1] - 1
+        mean_daily_return = daily_returns.mean() if len(daily_returns) > 0 else 0
 
-        # 8. Sharpe Ratio (무위험 수익률 0 가정)
+        # 7. Sharpe Ratio (무위험 수익률 0 가정)
+        # 표본 표준편차(ddof=1)는 2개 이상일 때만 정의됩니다. (pandas에서는 NaN → 0 처리)
         sharpe_ratio = 0
-        if len(daily_returns) > 0:
-            mean_daily_return = daily_returns.mean()
-            std_daily_return = daily_returns.std()
+        if len(daily_returns) > 1:
+            std_daily_return = daily_returns.std(ddof=1)
             if std_daily_return > 0:
                 sharpe_ratio = (mean_daily_return / std_daily_return) * np.sqrt(252)
 
-        # 9. Sortino Ratio (하방 리스크만 고려)
+        # 8. Sortino Ratio (하방 리스크만 고려)
         sortino_ratio = 0
-        if len(daily_returns) > 0:
-            mean_daily_return = daily_returns.mean()
-            # 하방 편차 계산 (음수 수익률만)
-            downside_returns = daily_returns[daily_returns < 0]
-            if len(downside_returns) > 0:
-                downside_std = downside_returns.std()
-                if downside_std > 0:
-                    sortino_ratio = (mean_daily_return / downside_std) * np.sqrt(252)
-
-        # 10. VaR (Value at Risk) 95% 신뢰수준
+        # 하방 편차 계산 (음수 수익률만)
+        downside_returns = daily_returns[daily_returns < 0]
+        if len(downside_returns) > 1:
+            downside_std = downside_returns.std(ddof=1)
+            if downside_std > 0:
+                sortino_ratio = (mean_daily_return / downside_std) * np.sqrt(252)
+
+        # 9. VaR (Value at Risk) 95% 신뢰수준
+        # np.quantile은 전체 정렬 대신 np.partition으로 필요한 두 원소만 찾습니다. (pandas와 같은 선형 보간)
         var_95 = 0
         if len(daily_returns) > 0:
-            var_95 = daily_returns.quantile(0.05)  # 5% 최악의 경우
+            var_95 = np.quantile(daily_returns, 0.05)  # 5% 최악의 경우
 
-        # 11. CVaR (Conditional VaR / Expected Shortfall) 95% 신뢰수준
+        # 10. CVaR (Conditional VaR / Expected Shortfall) 95% 신뢰수준
         cvar_95 = 0
         if len(daily_returns) > 0:
             cvar_95 = daily_returns[daily_returns <= var_95].mean()
 
-        # 12. 포지션 히스토리 (매일 보유 여부)
+        # 11. 포지션 히스토리 (매일 보유 여부)
         position_history = []
         if self.historical_data is not None:
-            current_position = None
-            for i in range(len(self.historical_data)):
-                date = self.historical_data.index[i]
-
-                # 해당 날짜의 매수/매도 체크
-                buy_today = any(t['date'] == date and t['type'] == 'buy' for t in self.trades)
-                sell_today = any(t['date'] == date and t['type'] == 'sell' for t in self.trades)
-
-                if buy_today:
-                    buy_trade = next(t for t in self.trades if t['date'] == date and t['type'] == 'buy')
-                    current_position = {
-                        "quantity": buy_trade['quantity'],
-                        "entry_price": buy_trade['price']
-                    }
-                elif sell_today:
-                    current_position = None
-
-                position_history.append({
-                    "timestamp": date.isoformat(),
-                    "has_position": current_position is not None,
-                    "quantity": current_position['quantity'] if current_position else 0,
-                    "entry_price": current_position['entry_price'] if current_position else 0
-                })
+            # 각 바 시점의 마지막 체결을 searchsorted로 찾아, 그 체결이 매수면 보유 중으로 봅니다.
+            # (체결 인덱스는 오름차순이며 한 바에서는 최대 한 번 체결)
+            trade_index = self.trades['index']
+            last_trade = np.searchsorted(trade_index, np.arange(len(self._timestamps)), side='right') - 1
+            has_trade = last_trade >= 0
+            holding = np.zeros(len(last_trade), dtype=bool)
+            holding[has_trade] = is_buy[last_trade[has_trade]]
+            # 미보유 바는 기존과 같이 int 0으로 직렬화되도록 object 배열에 채웁니다.
+            held_trades = last_trade[holding]
+            quantities = np.zeros(len(holding), dtype=object)
+            quantities[holding] = self.trades['quantity'][held_trades]
+            entry_prices = np.zeros(len(holding), dtype=object)
+            entry_prices[holding] = self.trades['price'][held_trades]
+            position_history = [
+                {
+                    "timestamp": timestamp,
+                    "has_position": has_position,
+                    "quantity": quantity,
+                    "entry_price": entry_price
+                }
+                for timestamp, has_position, quantity, entry_price in zip(
+                    self._timestamps, holding.tolist(), quantities.tolist(), entry_prices.tolist()
+                )
+            ]
 
         return {
             "total_return": total_return,
@@ -491,44 +776,27 @@ class BacktestService:
 
             # 5. 데이터 로드 및 시뮬레이션 실행
             await self._load_data(ticker, start_date, end_date)
-            self._calculate_indicators()
-
-            self.cash = self.initial_cash
-            self.position = None
-            self.trades = []
-            self.portfolio_history = []
-
-            print("✓ Starting simulation...")
-            buy_signal_count = 0
-            sell_signal_count = 0
 
-            if self.historical_data is not None:
-                for i in range(len(self.historical_data)):
-                    action = self._evaluate_conditions(i)
-
-                    if action == "buy":
-                        buy_signal_count += 1
-                        self._execute_buy(i)
-                    elif action == "sell":
-                        sell_signal_count += 1
-                        self._execute_sell(i)
-                    self._update_portfolio_value(i)
-
-            print(f"✓ Simulation completed: {buy_signal_count} buys, {sell_signal_count} sells")
+            # 6. 시뮬레이션 및 성과 지표 계산 (동일 전략·데이터는 캐시 재사용)
+            # CPU 작업은 전용 스레드에서 실행하여 계산 중에도 이벤트 루프가 다른 요청을 처리하도록 합니다.
+            loop = asyncio.get_running_loop()
+            buy_signal_count, sell_signal_count, performance = await loop.run_in_executor(
+                _SIMULATION_EXECUTOR, self._run_simulation
+            )
 
-            # 6. 성과 지표 계산
-            performance = self._calculate_performance_metrics()
+            logger.info(f"✓ Simulation completed: {buy_signal_count} buys, {sell_signal_count} sells")
 
             # 7. Equity curve 데이터 준비 (포트폴리오 히스토리를 JSON 형식으로)
             equity_curve = [
                 {
-                    "timestamp": item['date'].isoformat(),
-                    "value": float(item['value'])
+                    "timestamp": timestamp,
+                    "value": value
                 }
-                for item in self.portfolio_history
+                for timestamp, value in zip(self._timestamps, self.portfolio_history.tolist())
             ]
 
             # 8. KPI 데이터 준비 (추가 지표들)
+            # 거래는 열 단위 배열로 보관하고, 레코드(dict)는 직렬화 시점에만 만듭니다.
             kpi = {
                 "strategy_name": self.strategy.strategy_name,
                 "total_return": performance['total_return'],
@@ -549,13 +817,17 @@ class BacktestService:
                 "position_history": performance['position_history'],
                 "trades": [
                     {
-                        "type": t['type'],
-                        "date": t['date'].isoformat(),
-                        "price": float(t['price']),
-                        "quantity": float(t['quantity']),
-                        "profit": float(t.get('profit', 0))
+                        "type": "buy" if is_buy else "sell",
+                        "date": self._timestamps[index],
+                        "price": price,
+                        "quantity": quantity,
+                        "profit": profit
                     }
-                    for t in self.trades
+                    for index, is_buy, price, quantity, profit in zip(
+                        self.trades['index'].tolist(), self.trades['is_buy'].tolist(),
+                        self.trades['price'].tolist(), self.trades['quantity'].tolist(),
+                        self.trades['profit'].tolist(),
+                    )
                 ]
             }
 
@@ -637,6 +909,43 @@ class BacktestService:
             **performance
         }
 
+# ----------------------------------------------------------------------
+# run_batch 워커 (프로세스 풀에서 pickle 가능하도록 모듈 레벨에 정의)
+# ----------------------------------------------------------------------
+_batch_data: Optional[pd.DataFrame] = None
+# 워커 내 전략들이 공유하는 지표 캐시 (같은 길이의 EMA 등은 한 번만 계산)
+_batch_indicator_cache: Dict[str, Any] = {}
+
+
+def _init_batch_worker(historical_data: pd.DataFrame):
+    global _batch_data, _batch_indicator_cache
+    _batch_data = historical_data
+    _batch_indicator_cache = {}
+
+
+def _run_batch_item(strategy: StrategyDefinitionSchema) -> Dict[str, Any]:
+    service = BacktestService(strategy, db=None)
+    service.historical_data = _batch_data
+    service._indicator_cache = _batch_indicator_cache
+    _, _, performance = service._run_simulation()
+    return {
+        "strategy_name": strategy.strategy_name,
+        **performance
+    }
+
+
+def _run_many_item(
+    strategy: StrategyDefinitionSchema, ticker: str, historical_data: pd.DataFrame
+) -> Dict[str, Any]:
+    service = BacktestService(strategy, db=None)
+    service.historical_data = historical_data
+    _, _, performance = service._run_simulation()
+    return {
+        "ticker": ticker,
+        "strategy_name": strategy.strategy_name,
+        **performance
+    }
+
 # Example of how to run the service
 if __name__ == '__main__':
     # 이 파일은 이제 DB 세션(AsyncSession)에 의존하므로, 직접 실행하기 어렵습니다.
@@ -5,8 +5,8 @@ from typing import Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.repositories.user import UserRepository
-from app.schemas import (ErrorResponse, UserCreateRequest, UserListResponse,
-                         UserResponse, UserUpdateRequest)
+from app.schemas import (USER_LIST_ADAPTER, ErrorResponse, UserCreateRequest,
+                         UserListResponse, UserResponse, UserUpdateRequest)
 
 logger = logging.getLogger(__name__)
 
@@ -90,8 +90,8 @@ class UserService:
         """
         try:
             users = await self.user_repository.get_all(db, skip, limit)
-            user_responses = [
-                UserResponse.model_validate(user) for user in users]
+            user_responses = USER_LIST_ADAPTER.validate_python(
+                users, from_attributes=True)
             total = len(user_responses)
 
             user_list_response = UserListResponse(
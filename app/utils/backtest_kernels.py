@@ -0,0 +1,226 @@
+# app/utils/backtest_kernels.py
+"""
+백테스트 시뮬레이션용 Numba 커널
+
+매수/매도 신호 배열이 미리 계산되어 있다는 전제에서
+포지션 상태 전이(현금 → 보유 → 현금)를 한 번의 루프로 처리하며,
+조건 평가와 지표 계산의 순차 루프도 이곳에 모아 둡니다.
+커널은 GIL을 해제하므로(nogil) 시뮬레이션 스레드가 도는 동안에도 이벤트 루프 스레드가 계속 실행됩니다.
+"""
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba가 없는 환경에서는 같은 코드를 순수 Python으로 실행 (결과 동일, 속도만 느림)
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True, nogil=True)
+def simulate_long_only(buy_signal, sell_signal, close, initial_cash, invest_ratio):
+    """
+    롱 온리 상태 머신. 종가 체결, 한 번에 하나의 포지션만 보유합니다.
+
+    Args:
+        buy_signal: 바별 매수 신호 (bool 배열)
+        sell_signal: 바별 매도 신호 (bool 배열)
+        close: 종가 (float64 배열)
+        initial_cash: 초기 현금
+        invest_ratio: 매수 시 투입할 현금 비율 (order_amount_percent / 100)
+
+    Returns:
+        (trade_index, trade_is_buy, trade_price, trade_quantity, trade_profit, trade_cash,
+         held_quantity, buy_signal_count, sell_signal_count)
+        trade_* 배열은 체결 순서이며 trade_cash는 체결 직후 현금입니다.
+    """
+    n = close.shape[0]
+    # 한 바에서 최대 한 번 체결되므로 n개로 충분
+    trade_index = np.empty(n, dtype=np.int64)
+    trade_is_buy = np.empty(n, dtype=np.bool_)
+    trade_price = np.empty(n, dtype=np.float64)
+    trade_quantity = np.empty(n, dtype=np.float64)
+    trade_profit = np.zeros(n, dtype=np.float64)
+    trade_cash = np.empty(n, dtype=np.float64)
+    held_quantity = np.zeros(n, dtype=np.float64)
+
+    cash = initial_cash
+    quantity = 0.0
+    entry_price = 0.0
+    in_position = False
+    n_trades = 0
+    buy_signal_count = 0
+    sell_signal_count = 0
+
+    for i in range(n):
+        price = close[i]
+        if not in_position:
+            if buy_signal[i]:
+                buy_signal_count += 1
+                order_quantity = (cash * invest_ratio) // price
+                if order_quantity > 0:
+                    cash -= order_quantity * price
+                    quantity = order_quantity
+                    entry_price = price
+                    in_position = True
+                    trade_index[n_trades] = i
+                    trade_is_buy[n_trades] = True
+                    trade_price[n_trades] = price
+                    trade_quantity[n_trades] = quantity
+                    trade_cash[n_trades] = cash
+                    n_trades += 1
+        elif sell_signal[i]:
+            sell_signal_count += 1
+            cash += quantity * price
+            trade_index[n_trades] = i
+            trade_is_buy[n_trades] = False
+            trade_price[n_trades] = price
+            trade_quantity[n_trades] = quantity
+            trade_profit[n_trades] = (price - entry_price) * quantity
+            trade_cash[n_trades] = cash
+            n_trades += 1
+            in_position = False
+
+        if in_position:
+            held_quantity[i] = quantity
+
+    return (
+        trade_index[:n_trades],
+        trade_is_buy[:n_trades],
+        trade_price[:n_trades],
+        trade_quantity[:n_trades],
+        trade_profit[:n_trades],
+        trade_cash[:n_trades],
+        held_quantity,
+        buy_signal_count,
+        sell_signal_count,
+    )
+
+
+# 조건 연산자 코드 (BacktestService에서 OperatorEnum → 코드로 변환해 전달)
+OP_ABOVE = 0
+OP_BELOW = 1
+OP_ABOVE_OR_EQUAL = 2
+OP_BELOW_OR_EQUAL = 3
+OP_EQUALS = 4
+OP_NOT_EQUALS = 5
+OP_CROSSES_ABOVE = 6
+OP_CROSSES_BELOW = 7
+OP_BETWEEN = 8
+OP_OUTSIDE = 9
+OP_PERCENT_CHANGE_ABOVE = 10
+OP_PERCENT_CHANGE_BELOW = 11
+OP_CONSECUTIVE_ABOVE = 12
+OP_CONSECUTIVE_BELOW = 13
+
+
+@njit(cache=True, nogil=True)
+def evaluate_condition(op, val1, val2, val3, lookback):
+    """
+    단일 조건을 전체 기간에 대해 한 번의 루프로 평가합니다.
+    NaN 처리:
+        - 비교·크로스 연산자: NaN이 포함되면 False
+        - 연속 조건 연산자: NaN 바는 조건이 깨지지 않은 것으로 봄
+        - 범위 연산자: val3가 NaN이면 두 경계 모두 val2
+        - 변화율 연산자: 기준값이 NaN이거나 0이면 건너뜀 (False)
+
+    Args:
+        op: 연산자 코드 (OP_*)
+        val1, val2: 비교 대상 (float64 배열)
+        val3: 범위 연산자의 두 번째 경계 (그 외 연산자는 사용하지 않음)
+        lookback: 변화율/연속 조건의 기간 (기본값 적용 후의 값)
+
+    Returns:
+        바별 조건 충족 여부 (bool 배열)
+    """
+    n = val1.shape[0]
+    result = np.zeros(n, dtype=np.bool_)
+
+    if op == OP_ABOVE:
+        for i in range(n):
+            result[i] = val1[i] > val2[i]
+    elif op == OP_BELOW:
+        for i in range(n):
+            result[i] = val1[i] < val2[i]
+    elif op == OP_ABOVE_OR_EQUAL:
+        for i in range(n):
+            result[i] = val1[i] >= val2[i]
+    elif op == OP_BELOW_OR_EQUAL:
+        for i in range(n):
+            result[i] = val1[i] <= val2[i]
+    elif op == OP_EQUALS:
+        for i in range(n):
+            result[i] = abs(val1[i] - val2[i]) < 1e-9
+    elif op == OP_NOT_EQUALS:
+        for i in range(n):
+            result[i] = abs(val1[i] - val2[i]) >= 1e-9
+
+    # 크로스 연산자 (이전 값 필요, 첫 바는 항상 False)
+    elif op == OP_CROSSES_ABOVE:
+        for i in range(1, n):
+            result[i] = val1[i - 1] <= val2[i - 1] and val1[i] > val2[i]
+    elif op == OP_CROSSES_BELOW:
+        for i in range(1, n):
+            result[i] = val1[i - 1] >= val2[i - 1] and val1[i] < val2[i]
+
+    # 범위 연산자 (내장 min/max와 동일하게 NaN 비교 시 첫 번째 값 유지)
+    elif op == OP_BETWEEN or op == OP_OUTSIDE:
+        for i in range(n):
+            lower = val3[i] if val3[i] < val2[i] else val2[i]
+            upper = val3[i] if val3[i] > val2[i] else val2[i]
+            if op == OP_BETWEEN:
+                result[i] = lower < val1[i] and val1[i] < upper
+            else:
+                result[i] = val1[i] < lower or val1[i] > upper
+
+    # 변화율 연산자: lookback 바 이전 값 대비 변화율(%)을 val2와 비교
+    elif op == OP_PERCENT_CHANGE_ABOVE or op == OP_PERCENT_CHANGE_BELOW:
+        for i in range(n):
+            j = i - lookback
+            if j < 0 or j >= n:
+                continue
+            prev = val1[j]
+            if prev == 0 or np.isnan(prev):
+                continue
+            pct_change = ((val1[i] - prev) / prev) * 100
+            if op == OP_PERCENT_CHANGE_ABOVE:
+                result[i] = pct_change > val2[i]
+            else:
+                result[i] = pct_change < val2[i]
+
+    # 연속 조건 연산자: 최근 lookback 바 동안 조건이 한 번도 깨지지 않았는지 확인
+    elif op == OP_CONSECUTIVE_ABOVE or op == OP_CONSECUTIVE_BELOW:
+        if lookback <= 0:
+            result[:] = True
+        else:
+            last_broken = -lookback
+            for i in range(n):
+                if op == OP_CONSECUTIVE_ABOVE:
+                    broken = val1[i] <= val2[i]
+                else:
+                    broken = val1[i] >= val2[i]
+                if broken:
+                    last_broken = i
+                result[i] = i >= lookback - 1 and i - last_broken >= lookback
+
+    return result
+
+
+@njit(cache=True, nogil=True)
+def multi_ema(values: np.ndarray, lengths: np.ndarray, seeds: np.ndarray) -> np.ndarray:
+    """
+    여러 길이의 지수 이동평균을 종가 한 번 순회로 함께 계산합니다. 결과 shape: (n, len(lengths))
+    pandas-ta 기본값과 같이 각 EMA의 첫 값은 첫 구간의 SMA(seeds)로 시작합니다. (adjust=False)
+    """
+    n = values.shape[0]
+    k = lengths.shape[0]
+    out = np.full((n, k), np.nan)
+    alphas = 2.0 / (lengths + 1.0)
+    for j in range(k):
+        out[lengths[j] - 1, j] = seeds[j]
+    for i in range(n):
+        for j in range(k):
+            if i >= lengths[j]:
+                out[i, j] = alphas[j] * values[i] + (1.0 - alphas[j]) * out[i - 1, j]
+    return out
@@ -1,11 +1,68 @@
+import json
+import logging
+
+import numpy as np
 import pandas as pd
-import pandas_ta as ta
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from app.schemas.backtest import IndicatorSchema
+from app.utils.backtest_kernels import multi_ema
+
+logger = logging.getLogger(__name__)
+
+
+def _sma(values: np.ndarray, length: int) -> np.ndarray:
+    """단순 이동평균. pandas-ta와 동일한 결과를 내도록 pandas rolling 커널을 그대로 사용합니다."""
+    return pd.Series(values).rolling(length, min_periods=length).mean().to_numpy()
+
+
+def _fast_length(close: np.ndarray, params: Dict[str, Any]) -> Optional[int]:
+    """
+    pandas-ta를 거치지 않고 직접 계산해도 되는 경우 length를 반환합니다. (종가 기반, length 파라미터만 사용)
+    파라미터나 데이터가 기본 경로와 다르게 동작할 수 있으면 None을 반환하여 pandas-ta로 넘깁니다.
+    """
+    if set(params) - {"length"}:
+        return None
+
+    length = params.get("length", 10)  # pandas-ta 기본값
+    if isinstance(length, bool) or not isinstance(length, int) or length <= 0:
+        return None
+
+    if len(close) < length or np.isnan(close).any():
+        return None
+    return length
+
+
+def _calculate_emas(
+    close: np.ndarray, index: pd.Index, indicator_definitions: List[IndicatorSchema]
+) -> Dict[int, pd.Series]:
+    """직접 계산 가능한 EMA 정의를 모아 길이별 결과를 한 번에 계산합니다."""
+    lengths = sorted({
+        length
+        for indicator_def in indicator_definitions
+        if indicator_def.type.lower() == "ema"
+        and (length := _fast_length(close, indicator_def.params)) is not None
+    })
+    if not lengths:
+        return {}
+
+    # 시작값은 pandas와 같은 pairwise 합으로 계산해야 결과가 비트 단위로 일치합니다.
+    seeds = np.array([close[:length].mean() for length in lengths])
+    values = multi_ema(close, np.array(lengths, dtype=np.int64), seeds)
+    return {
+        length: pd.Series(values[:, j], index=index, name=f"EMA_{length}")
+        for j, length in enumerate(lengths)
+    }
+
+
+def _indicator_key(indicator_def: IndicatorSchema) -> str:
+    """지표 종류와 파라미터로 만든 캐시 키. 이름만 다른 동일 지표는 같은 키를 가집니다."""
+    return json.dumps([indicator_def.type.lower(), indicator_def.params], sort_keys=True, default=str)
+
 
 def calculate_indicators(
     historical_data: pd.DataFrame,
-    indicator_definitions: List[IndicatorSchema]
+    indicator_definitions: List[IndicatorSchema],
+    cache: Optional[Dict[str, Any]] = None,
 ) -> Dict[str, pd.Series]:
     """
     전략 정의에 명시된 모든 기술 지표를 계산합니다.
@@ -13,6 +70,8 @@ def calculate_indicators(
     Args:
         historical_data (pd.DataFrame): 'open', 'high', 'low', 'close', 'volume' 컬럼을 포함하는 OHLCV 데이터
         indicator_definitions (List[IndicatorSchema]): 계산할 지표의 정의 목록
+        cache (Optional[Dict[str, Any]]): 지표 결과 캐시 (종류+파라미터 → 결과).
+            같은 가격 데이터로 여러 전략을 계산할 때만 공유해야 하며, 새로 계산한 결과가 채워집니다.
 
     Returns:
         Dict[str, pd.Series]: 지표의 고유 이름(name)을 키로, 계산된 Series를 값으로 하는 딕셔너리
@@ -21,21 +80,53 @@ def calculate_indicators(
         return {}
 
     # pandas-ta는 컬럼 이름이 소문자일 것을 기대합니다.
-    data = historical_data.copy()
-    data.columns = [col.lower() for col in data.columns]
+    # 컬럼 이름만 바꾸면 되므로 값은 복사하지 않는 얕은 복사로 원본 프레임과 버퍼를 공유하며,
+    # 이미 소문자인 경우(_load_data 경로)에는 이름 변환도 생략합니다.
+    data = historical_data.copy(deep=False)
+    if any(col != col.lower() for col in data.columns):
+        data.columns = [col.lower() for col in data.columns]
 
     calculated_indicators = {}
+    if cache is None:
+        cache = {}
+
+    # SMA/EMA는 pandas-ta의 Series 생성·디스패치 비용 없이 직접 계산합니다.
+    # 캐시에 없는 여러 EMA는 종가를 한 번만 순회하며 함께 계산합니다.
+    close = data["close"].to_numpy(dtype=np.float64) if "close" in data.columns else np.empty(0)
+    emas = _calculate_emas(
+        close, data.index,
+        [indicator_def for indicator_def in indicator_definitions if _indicator_key(indicator_def) not in cache],
+    )
 
     for indicator_def in indicator_definitions:
         indicator_type = indicator_def.type.lower()
         indicator_params = indicator_def.params.copy()
-        
+
+        key = _indicator_key(indicator_def)
+        if key in cache:
+            calculated_indicators[indicator_def.name] = cache[key]
+            continue
+
+        if indicator_type in ("sma", "ema"):
+            length = _fast_length(close, indicator_params)
+            if length is not None:
+                if indicator_type == "ema":
+                    result = emas[length]
+                else:
+                    result = pd.Series(_sma(close, length), index=data.index, name=f"SMA_{length}")
+                calculated_indicators[indicator_def.name] = cache[key] = result
+                continue
+
+        # pandas-ta는 import 비용이 커서 앱 기동 시점이 아닌 실제로 필요한 시점에 로드합니다.
+        # (import 시 DataFrame.ta 접근자가 등록되며, 이후 호출은 모듈 캐시를 사용)
+        import pandas_ta  # noqa: F401
+
         # pandas-ta의 지표 함수를 동적으로 가져옵니다.
         # 예: indicator_type이 'sma'이면 df.ta.sma() 함수를 찾습니다.
         indicator_func = getattr(data.ta, indicator_type, None)
 
         if indicator_func is None:
-            print(f"Warning: Indicator type '{indicator_def.type}' not found in pandas_ta. Skipping.")
+            logger.warning(f"Indicator type '{indicator_def.type}' not found in pandas_ta. Skipping.")
             continue
 
         try:
@@ -51,9 +142,10 @@ def calculate_indicators(
                 calculated_indicators[indicator_def.name] = result
             else: # 대부분의 경우 결과는 Series 입니다.
                 calculated_indicators[indicator_def.name] = result
+            cache[key] = result
 
         except Exception as e:
-            print(f"[ERROR] Failed to calculate indicator '{indicator_def.name}': {e}")
+            logger.error(f"Failed to calculate indicator '{indicator_def.name}': {e}")
 
     return calculated_indicators
 
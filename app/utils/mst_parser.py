@@ -10,6 +10,8 @@ import zipfile
 
 ISIN_RE = re.compile(r"KR[A-Z0-9]{10}")
 SIX_DIGIT = re.compile(r"^\d{6}$")
+WHITESPACE_RE = re.compile(r"\s+")
+NAME_END_RE = re.compile(r"\s{2,}(?=[A-Z0-9])")
 
 def _decode_bytes(data: bytes) -> Tuple[str, str]:
     for enc in ("cp949", "euc-kr", "utf-8", "latin1"):
@@ -20,7 +22,7 @@ def _decode_bytes(data: bytes) -> Tuple[str, str]:
     return data.decode("latin1", errors="replace"), "latin1(replace)"
 
 def _clean_spaces(s: str) -> str:
-    return re.sub(r"\s+", " ", s.replace("\x00", " ")).strip()
+    return WHITESPACE_RE.sub(" ", s.replace("\x00", " ")).strip()
 
 # ==============================
 # 파일 읽기
@@ -65,7 +67,7 @@ def _parse_line(line: str) -> Optional[Tuple[str, str, str]]:
     if not left:
         return None
     pdno = left.split()[-1]
-    name = re.split(r"\s{2,}(?=[A-Z0-9])", right, maxsplit=1)[0]
+    name = NAME_END_RE.split(right, maxsplit=1)[0]
     return pdno, isin, _clean_spaces(name)
 
 # ==============================